@@ -1,14 +1,24 @@
 """budged – ForteBank statement parsing and spending analytics."""
 
-from budged.categories import mcc2name, mcc_groups, name_to_group
+from budged.categories import (
+    mcc2name,
+    mcc_code_to_name_and_group,
+    mcc_groups,
+    name_to_group,
+)
 from budged.parser import (
     DATE_PATTERN,
     SUM_PATTERN,
+    Details,
+    Transaction,
+    Transactions,
+    iter_pdf_rows,
     parse_details,
     parse_pdf,
     parse_row,
     parse_sum,
     parse_transactions,
+    resolve_backend,
 )
 from budged.aggregator import (
     group_by_description_and_mcc,
@@ -31,15 +41,21 @@ from budged.formatter import (
 
 __all__ = [
     "mcc2name",
+    "mcc_code_to_name_and_group",
     "mcc_groups",
     "name_to_group",
     "DATE_PATTERN",
     "SUM_PATTERN",
+    "Details",
+    "Transaction",
+    "Transactions",
+    "iter_pdf_rows",
     "parse_details",
     "parse_pdf",
     "parse_row",
     "parse_sum",
     "parse_transactions",
+    "resolve_backend",
     "group_by_description_and_mcc",
     "group_by_description_and_mcc_group",
     "compute_purchase_totals",
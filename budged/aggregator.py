@@ -2,52 +2,67 @@
 
 from collections import defaultdict
 
-from budged.categories import mcc2name, name_to_group
+from budged.parser import Transactions
 
 
-def group_by_description_and_mcc(data: list[dict]) -> dict[tuple[str, str], float]:
-    """
-    Summarize transaction amounts by (Description, MCC_Short_Name).
+def _sum_by_description_and_key(
+    data: Transactions, keys: list,
+) -> dict[tuple[str, str | None], float]:
+    """Sum amounts by (Description, keys[i]) in one pass over *data*.
 
-    "Purchase with bonuses" is folded into "Purchase" (offsets spend),
-    and a separate "Saved with bonuses" row tracks the bonus totals.
+    Sums are nested per description so each row hashes two strings (whose
+    hashes are cached) instead of building and hashing a fresh tuple.  The
+    result keeps the first-seen order of the pairs.
     """
-    aggregated: dict[tuple[str, str], float] = defaultdict(float)
+    by_desc: dict[str, dict[str | None, float]] = {}
+    order: list[tuple[str, str | None]] = []
+    for desc, key, amount in zip(data.descriptions, keys, data.sums):
+        inner = by_desc.get(desc)
+        if inner is None:
+            inner = by_desc[desc] = {}
+        if key in inner:
+            inner[key] += amount
+        else:
+            inner[key] = amount + 0.0  # normalizes -0.0 like a 0.0 start would
+            order.append((desc, key))
+    return {(desc, key): by_desc[desc][key] for desc, key in order}
+
 
-    for row in data:
-        desc = row["Description"]
-        mcc_code = row["Details"]["mcc"]
-        mcc_name = mcc2name.get(mcc_code, "Unknown/No MCC") if mcc_code else "No MCC"
+def _roll_up(totals: dict[tuple[str, str], float]) -> dict[tuple[str, str], float]:
+    """Re-key (Description, category) sums, splitting out bonuses."""
+    aggregated: dict[tuple[str, str], float] = defaultdict(float)
 
+    for (desc, category), total in totals.items():
         if desc == "Purchase with bonuses":
-            aggregated[("Purchase", mcc_name)] += row["Sum"]
-            aggregated[("Saved with bonuses", mcc_name)] += row["Sum"]
+            aggregated[("Purchase", category)] += total
+            aggregated[("Saved with bonuses", category)] += total
         else:
-            aggregated[(desc, mcc_name)] += row["Sum"]
+            aggregated[(desc, category)] += total
 
     return dict(aggregated)
 
 
-def group_by_description_and_mcc_group(data: list[dict]) -> dict[tuple[str, str], float]:
+def group_by_description_and_mcc(data: Transactions) -> dict[tuple[str, str], float]:
     """
-    Summarize transaction amounts by (Description, MCC_Group).
+    Summarize transaction amounts by (Description, MCC_Short_Name).
 
-    Rolls up MCC names into their broader category groups.
+    "Purchase with bonuses" is folded into "Purchase" (offsets spend),
+    and a separate "Saved with bonuses" row tracks the bonus totals.
     """
-    base = group_by_description_and_mcc(data)
-    group_aggregated: dict[tuple[str, str], float] = defaultdict(float)
+    # MCC names and groups are resolved at parse time, so rows are keyed directly.
+    return _roll_up(_sum_by_description_and_key(data, data.mcc_names))
 
-    for (desc, mcc_name), total_sum in base.items():
-        if mcc_name == "No MCC":
-            group_name = "Transfers/Other"
-        else:
-            group_name = name_to_group.get(mcc_name, "Other Uncategorized")
-        group_aggregated[(desc, group_name)] += total_sum
 
-    return dict(group_aggregated)
+def group_by_description_and_mcc_group(data: Transactions) -> dict[tuple[str, str], float]:
+    """
+    Summarize transaction amounts by (Description, MCC_Group).
+
+    Rolls up MCC codes straight into their broader category groups.
+    """
+    return _roll_up(_sum_by_description_and_key(data, data.mcc_groups))
 
 
-def compute_purchase_totals(data: list[dict]) -> dict[str, float]:
+def compute_purchase_totals(data: Transactions) -> dict[str, float]:
     """Compute summary totals from parsed transactions.
 
     Returns dict with keys: purchase_total, bonuses_total, net_purchases,
@@ -58,9 +73,7 @@ def compute_purchase_totals(data: list[dict]) -> dict[str, float]:
     grand_total = 0.0
     income_total = 0.0
 
-    for row in data:
-        desc = row["Description"]
-        amount = row["Sum"]
+    for desc, amount in zip(data.descriptions, data.sums):
         grand_total += amount
 
         if amount > 0:
@@ -70,7 +70,11 @@ mcc_groups: dict[str, list[str]] = {
     ],
 }
 
-name_to_group: dict[str, str] = {}
-for _group, _names in mcc_groups.items():
-    for _name in _names:
-        name_to_group[_name] = _group
+name_to_group: dict[str, str] = {
+    name: group for group, names in mcc_groups.items() for name in names
+}
+
+# MCC code → (name, group) in one lookup, instead of mcc2name then name_to_group.
+mcc_code_to_name_and_group: dict[str, tuple[str, str]] = {
+    code: (name, name_to_group.get(name, "Other Uncategorized")) for code, name in mcc2name.items()
+}
@@ -1,5 +1,9 @@
 """Report formatting: ASCII tables and text output."""
 
+from operator import itemgetter
+
+from budged.parser import Transactions
+
 SORT_BY_SUM = "sum"
 SORT_BY_NAME = "name"
 SORT_BY_DATE = "date"
@@ -12,49 +16,61 @@ REPORT_MCC = "mcc"
 REPORT_GROUP = "group"
 
 
-def _sort_key(item, sort_by=SORT_BY_SUM):
-    (desc, category), total = item
-    if sort_by == SORT_BY_NAME:
-        return (desc, category)
-    return (total,)
-
-
-def _stringify(value) -> str:
-    if isinstance(value, float):
-        return f"{value:,.2f}"
-    if value is None:
-        return ""
-    return str(value)
+def _stringify_column(values) -> tuple[list[str], bool]:
+    """
+    Return the cell texts of a column and whether it is numeric.
+
+    A column is numeric (right-aligned) when all of its non-empty cells are
+    ints or floats; floats render with thousands separators.
+    """
+    texts: list[str] = []
+    numeric: bool | None = None
+    for value in values:
+        if isinstance(value, float):
+            text = f"{value:,.2f}"
+            is_numeric = True
+        elif value is None:
+            texts.append("")
+            continue
+        else:
+            text = str(value)
+            is_numeric = isinstance(value, int) and not isinstance(value, bool)
+        if text:
+            numeric = is_numeric and numeric is not False
+        texts.append(text)
+    return texts, bool(numeric)
 
 
 def format_ascii_table(headers: list[str], rows: list[list], title: str | None = None) -> str:
-    """Render *headers* and *rows* as a box-drawing ASCII table."""
-    str_rows = [[_stringify(c) for c in row] for row in rows]
-    col_widths = [len(h) for h in headers]
-    for row in str_rows:
-        for i, cell in enumerate(row):
-            col_widths[i] = max(col_widths[i], len(cell))
+    """Render *headers* and *rows* as a box-drawing ASCII table.
+
+    A column is right-aligned when all of its non-empty cells are numbers.
+    """
+    # Work column by column: one stringify call and one max() per column.
+    columns: list[list[str]] = []
+    col_widths: list[int] = []
+    numeric: list[bool] = []
+    for i, header in enumerate(headers):
+        texts, is_numeric = _stringify_column([row[i] for row in rows])
+        columns.append(texts)
+        col_widths.append(max(len(header), max(map(len, texts), default=0)))
+        numeric.append(is_numeric)
 
     def sep(left, mid, right, fill="─"):
         return left + mid.join(fill * (w + 2) for w in col_widths) + right
 
-    def data_line(cells):
-        parts = []
-        for i, cell in enumerate(cells):
-            if isinstance(cell, str) and cell.replace(",", "").replace(".", "").replace("-", "").isdigit():
-                parts.append(cell.rjust(col_widths[i]))
-            else:
-                parts.append(cell.ljust(col_widths[i]))
-        return "│ " + " │ ".join(parts) + " │"
+    header_fmt = "│ " + " │ ".join(f"{{:<{w}}}" for w in col_widths) + " │"
+    row_fmt = "│ " + " │ ".join(
+        f"{{:>{w}}}" if is_numeric else f"{{:<{w}}}" for w, is_numeric in zip(col_widths, numeric)
+    ) + " │"
 
     lines: list[str] = []
     if title:
         lines.append(title)
     lines.append(sep("┌", "┬", "┐"))
-    lines.append(data_line(headers))
+    lines.append(header_fmt.format(*headers))
     lines.append(sep("├", "┼", "┤"))
-    for row in str_rows:
-        lines.append(data_line(row))
+    lines.extend(row_fmt.format(*cells) for cells in zip(*columns))
     lines.append(sep("└", "┴", "┘"))
     return "\n".join(lines)
 
@@ -64,21 +80,34 @@ def format_aggregated(
     title: str,
     sort_by: str = SORT_BY_SUM,
     fmt: str = FMT_SIMPLE,
+    totals: dict[str, float] | None = None,
 ) -> str:
-    """Format an aggregation dict with summary lines for Purchase and bonuses."""
-    sorted_items = sorted(agg.items(), key=lambda it: _sort_key(it, sort_by))
-
-    purchase_total = 0.0
-    bonuses_total = 0.0
-    display_items: list[tuple] = []
+    """Format an aggregation dict with summary lines for Purchase and bonuses.
+
+    *totals* is the ``compute_purchase_totals`` result for the same data;
+    when given, the purchase and bonus sums are taken from it instead of
+    being re-accumulated from *agg*.
+    """
+    # (desc, category) keys sort by name; totals are plain floats.
+    sorted_items = sorted(agg.items(), key=itemgetter(0 if sort_by == SORT_BY_NAME else 1))
+
+    if totals is None:
+        purchase_total = 0.0
+        bonuses_total = 0.0
+        for (desc, _), total in sorted_items:
+            if desc == "Saved with bonuses":
+                bonuses_total += total
+            elif desc == "Purchase":
+                purchase_total += total
+    else:
+        purchase_total = totals["purchase_total"]
+        bonuses_total = totals["bonuses_total"]
 
-    for (desc, category), total in sorted_items:
-        if desc == "Saved with bonuses":
-            bonuses_total += total
-            continue
-        if desc == "Purchase":
-            purchase_total += total
-        display_items.append((desc, category, total))
+    display_items = [
+        (desc, category, total)
+        for (desc, category), total in sorted_items
+        if desc != "Saved with bonuses"
+    ]
 
     if fmt == FMT_ASCII:
         headers = ["Description", "Category", "Sum (KZT)"]
@@ -100,43 +129,46 @@ def format_aggregated(
 
 
 def format_raw_report(
-    parsed_data: list[dict],
+    parsed_data: Transactions,
     sort_by: str = SORT_BY_SUM,
     fmt: str = FMT_ASCII,
 ) -> str:
     """Format every parsed transaction with a summary footer."""
+    dates = parsed_data.dates
+    sums = parsed_data.sums
+    descriptions = parsed_data.descriptions
+    # Sort indices by a key list built once, so comparisons never re-split
+    # dates or rebuild tuples.
+    order = range(len(parsed_data))
     if sort_by == SORT_BY_DATE:
-        sorted_data = sorted(parsed_data, key=lambda r: r["Date"].split(".")[::-1])
+        keys = [date[6:10] + date[3:5] + date[0:2] for date in dates]  # dd.mm.yyyy -> yyyymmdd
+        order = sorted(order, key=keys.__getitem__)
     elif sort_by == SORT_BY_SUM:
-        sorted_data = sorted(parsed_data, key=lambda r: r["Sum"])
+        order = sorted(order, key=sums.__getitem__)
     elif sort_by == SORT_BY_NAME:
-        sorted_data = sorted(parsed_data, key=lambda r: (r["Description"], r["Details"]["raw"]))
-    else:
-        sorted_data = parsed_data
+        keys = list(zip(descriptions, parsed_data.raws))
+        order = sorted(order, key=keys.__getitem__)
 
     purchase_total = 0.0
     bonuses_total = 0.0
     grand_total = 0.0
-    display_rows: list[tuple] = []
-
-    for row in sorted_data:
-        desc = row["Description"]
-        amount = row["Sum"]
+    for desc, amount in zip(descriptions, sums):
         grand_total += amount
         if desc == "Purchase with bonuses":
             bonuses_total += amount
             purchase_total += amount
-            desc = "Purchase"
         elif desc == "Purchase":
             purchase_total += amount
 
-        mcc = row["Details"]["mcc"] or ""
-        receiver = row["Details"]["receiver_account"]
-        if receiver:
-            label = f"card *{receiver[-4:]}"
-        else:
-            label = row["Details"]["merchant"] or ""
-        display_rows.append((row["Date"], desc, label, mcc, amount))
+    # Derive each display column once over the flat columns, then gather
+    # rows in sorted order.
+    types = ["Purchase" if desc == "Purchase with bonuses" else desc for desc in descriptions]
+    labels = [
+        f"card *{receiver[-4:]}" if receiver else merchant or ""
+        for receiver, merchant in zip(parsed_data.receiver_accounts, parsed_data.merchants)
+    ]
+    mccs = [mcc or "" for mcc in parsed_data.mccs]
+    display_rows = [(dates[i], types[i], labels[i], mccs[i], sums[i]) for i in order]
 
     if fmt == FMT_ASCII:
         headers = ["Date", "Type", "Description", "MCC", "Sum (KZT)"]
@@ -1,78 +1,237 @@
 """PDF parsing and transaction extraction for ForteBank statements."""
 
+import os
 import re
+from bisect import bisect_right
+from collections.abc import Iterator, Sequence
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from functools import lru_cache
+from itertools import repeat
 from pathlib import Path
 
-import pdfplumber
+import pypdfium2 as pdfium
+
+from budged.categories import mcc_code_to_name_and_group
 
 DATE_PATTERN = re.compile(r"^\d{2}\.\d{2}\.\d{4}$")
 SUM_PATTERN = re.compile(r"^-?[\d,.]+\s+KZT$")
 
+# DATE_PATTERN and SUM_PATTERN fused, matched against "<date>\0<sum>"; cell
+# text never contains NUL, so neither cell can spill into the other.
+_DATA_ROW_RE = re.compile(r"\d{2}\.\d{2}\.\d{4}\x00-?[\d,.]+\s+KZT")
+
+_SUM_STRIP = re.compile(r"[^\d\.\-]")
+
+_BANK_KEYWORDS: dict[str, str] = {
+    "JSC Halyk Bank": "Halyk Bank",
+    "Halyk Bank": "Halyk Bank",
+    "Kaspi Bank": "Kaspi Bank",
+    "Freedom Bank": "Freedom Bank",
+    "Jusan Bank": "Jusan Bank",
+    "Bereke Bank": "Bereke Bank",
+    "BCC": "BCC",
+}
+# When several banks are named, the one listed first above wins.
+_BANK_RANK = {keyword: rank for rank, keyword in enumerate(_BANK_KEYWORDS)}
+
+
+def _trie_pattern(words) -> str:
+    """
+    Build a regex alternation for *words* shaped as a prefix trie.
+
+    Shared prefixes are tested once, so at each position the engine checks
+    a single character per branch instead of retrying every keyword.
+    """
+    trie: dict = {}
+    for word in words:
+        node = trie
+        for char in word:
+            node = node.setdefault(char, {})
+        node[""] = {}
+
+    def build(node: dict) -> str:
+        branches = [re.escape(char) + build(child) for char, child in sorted(node.items()) if char]
+        if not branches:
+            return ""
+        body = branches[0] if len(branches) == 1 else "(?:" + "|".join(branches) + ")"
+        return f"(?:{body})?" if "" in node else body
+
+    return build(trie)
+
+
+# Every probe parse_details needs, so a details string is scanned only once.
+# Stays on stdlib re: details strings are ~60 chars, where google-re2's
+# per-call overhead makes it about 5x slower than this pattern.
+DETAILS_RE = re.compile(
+    r"(?P<mcc>(?i:MCC|МСС):\s*(?P<mcc_code>\d{4}))"
+    r"|(?P<apay>(?i:APPLE PAY))"
+    r"|(?P<recv>Receiver:\s*(?P<recv_account>[\d\*]+))"
+    r"|(?P<bank>" + _trie_pattern(_BANK_KEYWORDS) + r")"
+)
+# A transfer's details are usually nothing but the receiver's masked card.
+_RECEIVER_ONLY_RE = re.compile(r"Receiver:\s*([\d\*]+)")
+
+# (name, group) for MCC codes missing from the mapping.
+_UNKNOWN_MCC = ("Unknown/No MCC", "Other Uncategorized")
+
+# Layout thresholds in PDF points: glyphs whose baselines differ by less than
+# _LINE_TOLERANCE share a visual line, glyphs drawn back to back (within
+# _RUN_GAP) form one text run, and runs further apart than _COLUMN_GAP belong
+# to different table cells.
+_LINE_TOLERANCE = 2.0
+_RUN_GAP = 0.5
+_COLUMN_GAP = 4.0
+
+# Shorter statements parse faster than a process pool starts.
+_PARALLEL_MIN_PAGES = 2
+
 
 def parse_sum(sum_str: str) -> float:
     """Convert a string like '-30000.00 KZT' to a float."""
-    clean_str = re.sub(r"[^\d\.\-]", "", sum_str)
+    # Statement amounts are "[-]digits[.digits] KZT" with optional commas;
+    # plain str methods handle those far faster than the regex below.
+    number = sum_str.removesuffix(" KZT").replace(",", "")
+    if number.lstrip("-").replace(".", "").isdecimal():
+        try:
+            return float(number)
+        except ValueError:
+            pass
+    # Anything else (e.g. no-break space separators): keep digits, "." and "-".
     try:
-        return float(clean_str)
+        return float(_SUM_STRIP.sub("", sum_str))
     except ValueError:
         return 0.0
 
 
-def parse_details(details_str: str) -> dict:
-    """Parse the Details string into a structured dictionary."""
-    details_map = {
-        "raw": details_str.strip(),
-        "merchant": None,
-        "bank": None,
-        "mcc": None,
-        "payment_method": None,
-        "receiver_account": None,
-    }
-
-    mcc_match = re.search(r"MCC:\s*(\d{4})|МСС:\s*(\d{4})", details_str, re.IGNORECASE)
-    if mcc_match:
-        details_map["mcc"] = mcc_match.group(1) or mcc_match.group(2)
-
-    if "APPLE PAY" in details_str.upper():
-        details_map["payment_method"] = "APPLE PAY"
-
-    bank_keywords = {
-        "Halyk Bank": ["JSC Halyk Bank", "Halyk Bank"],
-        "Kaspi Bank": ["Kaspi Bank"],
-        "Freedom Bank": ["Freedom Bank"],
-        "Jusan Bank": ["Jusan Bank"],
-        "Bereke Bank": ["Bereke Bank"],
-        "BCC": ["BCC"],
-    }
-    for bank_name, keywords in bank_keywords.items():
-        if any(kw in details_str for kw in keywords):
-            details_map["bank"] = bank_name
-            break
-
-    receiver_match = re.search(r"Receiver:\s*([\d\*]+)", details_str)
-    if receiver_match:
-        details_map["receiver_account"] = receiver_match.group(1)
+@dataclass(slots=True, frozen=True)
+class Details:
+    """Fields pulled out of a transaction's Details column."""
+
+    raw: str
+    merchant: str | None = None
+    bank: str | None = None
+    mcc: str | None = None
+    mcc_name: str = "No MCC"
+    mcc_group: str = "Transfers/Other"
+    payment_method: str | None = None
+    receiver_account: str | None = None
+
+
+@dataclass(slots=True, frozen=True)
+class Transaction:
+    """A single parsed statement row."""
+
+    date: str
+    sum: float
+    description: str
+    details: Details
+
+
+@lru_cache(maxsize=2048)
+def parse_details(details_str: str) -> Details:
+    """
+    Parse the Details string into a structured ``Details`` record.
+
+    Memoized: frequent merchants repeat the same details string many times
+    per statement, and ``Details`` is frozen, so one instance is safely
+    shared.
+    """
+    raw = details_str.strip()
+    if raw.startswith("Receiver:") and (match := _RECEIVER_ONLY_RE.fullmatch(raw)):
+        return Details(raw=raw, receiver_account=match.group(1))
+
+    bank = mcc = payment_method = receiver_account = None
+    bank_rank = len(_BANK_RANK)
+
+    for match in DETAILS_RE.finditer(details_str):
+        kind = match.lastgroup
+        if kind == "mcc":
+            if mcc is None:
+                mcc = match.group("mcc_code")
+        elif kind == "apay":
+            payment_method = "APPLE PAY"
+        elif kind == "recv":
+            if receiver_account is None:
+                receiver_account = match.group("recv_account")
+        elif (rank := _BANK_RANK[keyword := match.group("bank")]) < bank_rank:
+            bank, bank_rank = _BANK_KEYWORDS[keyword], rank
+
+    if mcc:
+        mcc_name, mcc_group = mcc_code_to_name_and_group.get(mcc, _UNKNOWN_MCC)
+    else:
+        mcc_name, mcc_group = "No MCC", "Transfers/Other"
 
+    merchant = None
     parts = details_str.split(",")
-    if len(parts) > 1 and not receiver_match:
-        details_map["merchant"] = parts[0].strip()
+    if len(parts) > 1 and receiver_account is None:
+        merchant = parts[0].strip()
 
-    return details_map
+    return Details(
+        raw=raw,
+        merchant=merchant,
+        bank=bank,
+        mcc=mcc,
+        mcc_name=mcc_name,
+        mcc_group=mcc_group,
+        payment_method=payment_method,
+        receiver_account=receiver_account,
+    )
 
 
-def parse_row(date: str, sum_str: str, description: str, details_str: str) -> dict:
-    """Parse a single raw row into a structured transaction dictionary."""
-    return {
-        "Date": date.strip(),
-        "Sum": parse_sum(sum_str),
-        "Description": description.strip(),
-        "Details": parse_details(details_str),
-    }
+def parse_row(date: str, sum_str: str, description: str, details_str: str) -> Transaction:
+    """Parse a single raw row into a ``Transaction``."""
+    return Transaction(
+        date=date.strip(),
+        sum=parse_sum(sum_str),
+        description=description.strip(),
+        details=parse_details(details_str),
+    )
 
 
-def parse_transactions(raw_data: list[tuple[str, str, str, str]]) -> list[dict]:
-    """Convert raw PDF tuples into structured transaction dicts."""
-    return [parse_row(d, s, desc, det) for d, s, desc, det in raw_data]
+@dataclass
+class Transactions:
+    """
+    Parsed transactions stored column-wise (structure of arrays).
+
+    Index *i* of every column describes the same transaction, so consumers
+    zip or index just the columns they need instead of one dict per row.
+    """
+
+    dates: list[str]
+    sums: list[float]
+    descriptions: list[str]
+    raws: list[str]
+    merchants: list[str | None]
+    banks: list[str | None]
+    mccs: list[str | None]
+    mcc_names: list[str]
+    mcc_groups: list[str]
+    payment_methods: list[str | None]
+    receiver_accounts: list[str | None]
+
+    def __len__(self) -> int:
+        return len(self.dates)
+
+
+def parse_transactions(raw_data: list[tuple[str, str, str, str]]) -> Transactions:
+    """Convert raw PDF tuples into column-wise ``Transactions``."""
+    # Parse each details string once (memoized), then fill every column with
+    # its own comprehension rather than indexing ten lists per row.
+    details = [parse_details(details_str) for _, _, _, details_str in raw_data]
+    return Transactions(
+        dates=[date.strip() for date, _, _, _ in raw_data],
+        sums=[parse_sum(sum_str) for _, sum_str, _, _ in raw_data],
+        descriptions=[description.strip() for _, _, description, _ in raw_data],
+        raws=[d.raw for d in details],
+        merchants=[d.merchant for d in details],
+        banks=[d.bank for d in details],
+        mccs=[d.mcc for d in details],
+        mcc_names=[d.mcc_name for d in details],
+        mcc_groups=[d.mcc_group for d in details],
+        payment_methods=[d.payment_method for d in details],
+        receiver_accounts=[d.receiver_account for d in details],
+    )
 
 
 def _is_data_row(row: list) -> bool:
@@ -82,42 +241,333 @@ def _is_data_row(row: list) -> bool:
     date, sum_str = row[0], row[1]
     if not date or not sum_str:
         return False
-    return bool(DATE_PATTERN.match(date.strip()) and SUM_PATTERN.match(sum_str.strip()))
+    return _DATA_ROW_RE.fullmatch(f"{date.strip()}\x00{sum_str.strip()}") is not None
 
 
 def _clean_details(details: str | None) -> str:
-    """Remove PDF line-wrapping artifacts from the Details field."""
+    """
+    Remove PDF line-wrapping artifacts from the Details field.
+
+    Every newline and whitespace run becomes a single space; punctuation
+    before a wrap is kept as is.
+    """
     if not details:
         return ""
-    cleaned = re.sub(r"(?<![,.])\n", " ", details)
-    cleaned = re.sub(r"([,.])\n", r"\1 ", cleaned)
-    cleaned = re.sub(r"\s{2,}", " ", cleaned)
-    return cleaned.strip()
+    return " ".join(details.split())
 
 
-def parse_pdf(pdf_path: str | Path) -> list[tuple[str, str, str, str]]:
+def _page_runs(textpage) -> list[tuple[float, float, list[tuple[float, float, str]]]]:
     """
-    Parse a ForteBank card statement PDF into a list of transaction tuples.
+    Bucket the glyphs of a page into visual lines by their y-coordinate.
+
+    Returns ``(top, bottom, runs)`` per line, top of the page first.  A run is
+    a ``(left, right, text)`` stretch of glyphs drawn back to back, in content
+    stream order, so text overflowing into a neighbouring column still stays
+    with the cell it was drawn for.
+    """
+    buckets: dict[int, list[tuple[int, float, float, float, str]]] = {}
+    text = textpage.get_text_range()
+    for index, char in enumerate(text):
+        left, bottom, right, top = textpage.get_charbox(index, loose=True)
+        if right <= left:
+            # pdfium-generated spaces and line breaks have no extent
+            continue
+        buckets.setdefault(round(bottom), []).append((index, top, left, right, char))
+
+    lines: list[tuple[int, list]] = []
+    for key in sorted(buckets, reverse=True):
+        if lines and lines[-1][0] - key <= _LINE_TOLERANCE:
+            lines[-1][1].extend(buckets[key])
+        else:
+            lines.append((key, buckets[key]))
+
+    result = []
+    for bottom, glyphs in lines:
+        glyphs.sort()
+        runs: list[list] = []
+        for _, _, left, right, char in glyphs:
+            if runs and abs(left - runs[-1][1]) <= _RUN_GAP:
+                runs[-1][1] = right
+                runs[-1][2].append(char)
+            else:
+                runs.append([left, right, [char]])
+        top = max(glyph[1] for glyph in glyphs)
+        result.append((top, float(bottom), [(left, right, "".join(chars)) for left, right, chars in runs]))
+    return result
+
+
+def _cluster_cells(runs: list[tuple[float, float, str]]) -> list[tuple[float, float, str]]:
+    """Merge runs into ``(left, right, text)`` cells separated by wide gaps."""
+    cells: list[list] = []
+    for left, right, text in runs:
+        if cells and 0 <= left - cells[-1][1] <= _COLUMN_GAP:
+            cells[-1][1] = right
+            cells[-1][2].append(text)
+        else:
+            cells.append([left, right, [text]])
+    return [(left, right, " ".join(" ".join(texts).split())) for left, right, texts in cells]
+
+
+def _slice_cells(runs: list[tuple[float, float, str]], boundaries: list[float]) -> list[str]:
+    """Assign each run to a column by where it starts, using known x-boundaries."""
+    cells: list[list[str]] = [[] for _ in range(len(boundaries) + 1)]
+    for left, _, text in runs:
+        cells[bisect_right(boundaries, left)].append(text)
+    return [" ".join(" ".join(texts).split()) for texts in cells]
+
+
+# Column titles of the statement table, repeated at the top of every page.
+_HEADER_CELLS = ["Date", "Sum", "Description", "Details"]
+
+
+def _column_boundaries(lines) -> list[float] | None:
+    """
+    Derive column x-boundaries from a page's lines.
+
+    The first line that clusters into a full data row is used; failing
+    that, the left edges of the header cells, so pages whose rows all have
+    an empty cell can still be sliced.
+    """
+    header = None
+    for _, _, runs in lines:
+        spans = _cluster_cells(runs)
+        cells = [text for _, _, text in spans]
+        if _is_data_row(cells):
+            return [min((a[1] + b[0]) / 2, b[0]) for a, b in zip(spans, spans[1:])]
+        if header is None and cells == _HEADER_CELLS:
+            header = [left for left, _, _ in spans[1:]]
+    return header
+
 
-    Returns a list of (date, sum, description, details) tuples.
+def _assemble_rows(lines, boundaries: list[float]) -> list[list[str]]:
+    """
+    Group a page's lines into table rows.
+
+    Lines stacked closer than half a line height belong to one row, since
+    cell padding always leaves a wider gap between rows.  Such a block
+    becomes a row when it holds a data line (date and sum); the text of its
+    other lines is joined to the matching cells newline-separated, in page
+    order, whether it was drawn above or below the date (top-, middle- or
+    bottom-aligned cells).  A line with text in the first column always
+    starts a new block once the current one has its data line.
+    """
+    blocks: list[list] = []  # [lines' cells, has a data line]
+    prev_bottom = None
+    for top, bottom, runs in lines:
+        cells = _slice_cells(runs, boundaries)
+        is_data = _is_data_row(cells)
+        if (
+            blocks
+            and prev_bottom - top < (top - bottom) / 2
+            and not (cells[0] and blocks[-1][1])
+        ):
+            blocks[-1][0].append(cells)
+            blocks[-1][1] = blocks[-1][1] or is_data
+        else:
+            blocks.append([[cells], is_data])
+        prev_bottom = bottom
+
+    rows: list[list[str]] = []
+    for block, has_data in blocks:
+        if has_data:
+            rows.append(["\n".join(filter(None, column)) for column in zip(*block)])
+    return rows
+
+
+def _iter_page_rows(
+    pdf: pdfium.PdfDocument,
+    pages: Sequence[int] | None = None,
+    boundaries: list[float] | None = None,
+) -> Iterator[tuple[list[list[str]], list[float] | None]]:
+    """
+    Reconstruct table rows from glyph positions, one page at a time.
+
+    Column x-boundaries are learned once (see ``_column_boundaries``) unless
+    given, and reused for every page, so later pages are sliced directly
+    instead of being re-clustered.  Pages read before the boundaries are
+    known are held back and sliced as soon as they are, so no rows are
+    lost.  Yields each page's rows with the boundaries in effect after it.
+    """
+    pending: list[list] = []
+    for index in range(len(pdf)) if pages is None else pages:
+        page = pdf[index]
+        textpage = page.get_textpage()
+        lines = _page_runs(textpage)
+        textpage.close()
+        page.close()
+        if boundaries is None:
+            boundaries = _column_boundaries(lines)
+            if boundaries is None:
+                pending.append(lines)
+                yield [], None
+                continue
+
+        page_rows: list[list[str]] = []
+        for held in pending:
+            page_rows += _assemble_rows(held, boundaries)
+        pending.clear()
+        page_rows += _assemble_rows(lines, boundaries)
+        yield page_rows, boundaries
+
+
+def _extract_tables_pdfium(
+    pdf_path: Path,
+    pages: Sequence[int] | None = None,
+    boundaries: list[float] | None = None,
+) -> Iterator[list[str]]:
+    with pdfium.PdfDocument(pdf_path) as pdf:
+        for page_rows, _ in _iter_page_rows(pdf, pages, boundaries):
+            yield from page_rows
+
+
+def _extract_tables_pymupdf(pdf_path: Path, pages: Sequence[int] | None = None) -> Iterator[list]:
+    import pymupdf
+
+    # Newer releases print a layout-package tip to stdout, which would corrupt
+    # the MCP server's JSON-RPC stream.
+    if hasattr(pymupdf, "no_recommend_layout"):
+        pymupdf.no_recommend_layout()
+
+    with pymupdf.open(pdf_path) as doc:
+        for index in range(len(doc)) if pages is None else pages:
+            for table in doc[index].find_tables().tables:
+                yield from table.extract()
+
+
+def _extract_tables_pdfplumber(pdf_path: Path, pages: Sequence[int] | None = None) -> Iterator[list]:
+    import pdfplumber
+
+    with pdfplumber.open(pdf_path) as pdf:
+        for index in range(len(pdf.pages)) if pages is None else pages:
+            for table in pdf.pages[index].extract_tables():
+                yield from table
+
+
+# pdfium is the default and by far the fastest; pymupdf and pdfplumber use
+# generic table detection and are optional installs, handy for cross-checking
+# the extraction on statements with an unfamiliar layout.
+PDF_BACKENDS = {
+    "pdfium": _extract_tables_pdfium,
+    "pymupdf": _extract_tables_pymupdf,
+    "pdfplumber": _extract_tables_pdfplumber,
+}
+DEFAULT_PDF_BACKEND = "pdfium"
+
+
+def resolve_backend(backend: str | None = None) -> str:
+    """
+    Return the name of the PDF backend to use.
+
+    *backend* wins, then the ``PARSE_PDF_BACKEND`` environment variable,
+    then ``DEFAULT_PDF_BACKEND``.  Raises ``ValueError`` for unknown names.
+    """
+    backend = backend or os.environ.get("PARSE_PDF_BACKEND") or DEFAULT_PDF_BACKEND
+    if backend not in PDF_BACKENDS:
+        raise ValueError(
+            f"Unknown PDF backend {backend!r}; expected one of: {', '.join(PDF_BACKENDS)}"
+        )
+    return backend
+
+
+def _extract_tables(pdf_path: Path, backend: str | None = None) -> Iterator[list]:
+    """
+    Yield the table rows of *pdf_path* using the chosen extraction backend.
+
+    *backend* defaults to the ``PARSE_PDF_BACKEND`` environment variable,
+    then to ``DEFAULT_PDF_BACKEND``.
+    """
+    return PDF_BACKENDS[resolve_backend(backend)](pdf_path)
+
+
+def _extract_pages(
+    pdf_path: Path, backend: str, pages: range, boundaries: list[float] | None,
+) -> list[list]:
+    """Extract the table rows of *pages*; runs inside a worker process."""
+    if backend == "pdfium":
+        return list(_extract_tables_pdfium(pdf_path, pages, boundaries))
+    return list(PDF_BACKENDS[backend](pdf_path, pages))
+
+
+def _extract_tables_parallel(pdf_path: Path, backend: str | None, workers: int) -> list[list]:
+    """
+    Extract table rows with pages split across *workers* processes.
+
+    Pages are handed out in contiguous chunks and the results concatenated
+    in page order.  For pdfium, the column boundaries are learned here first
+    so every worker slices its pages exactly as a sequential run would.
+    """
+    backend = resolve_backend(backend)
+    with pdfium.PdfDocument(pdf_path) as pdf:
+        page_count = len(pdf)
+        if page_count <= _PARALLEL_MIN_PAGES:
+            return list(_extract_tables(pdf_path, backend))
+
+        head_rows: list[list] = []
+        boundaries = None
+        first = 0
+        if backend == "pdfium":
+            for rows, boundaries in _iter_page_rows(pdf):
+                head_rows += rows
+                first += 1
+                if boundaries is not None:
+                    break
+
+    if first == page_count:
+        return head_rows
+
+    chunk = -(-(page_count - first) // workers)
+    ranges = [range(start, min(start + chunk, page_count)) for start in range(first, page_count, chunk)]
+    table_rows = head_rows
+    with ProcessPoolExecutor(max_workers=len(ranges)) as executor:
+        for rows in executor.map(
+            _extract_pages,
+            repeat(pdf_path), repeat(backend), ranges, repeat(boundaries),
+        ):
+            table_rows += rows
+    return table_rows
+
+
+def _iter_pdf_rows(pdf_path: Path, backend: str | None, workers: int) -> Iterator[tuple[str, str, str, str]]:
+    if workers > 1:
+        table_rows = _extract_tables_parallel(pdf_path, backend, workers)
+    else:
+        table_rows = _extract_tables(pdf_path, backend)
+
+    for row in table_rows:
+        if not _is_data_row(row):
+            continue
+        date = row[0].strip()
+        sum_str = row[1].strip()
+        description = row[2].strip()
+        details = _clean_details(row[3])
+        yield date, sum_str, description, details
+
+
+def iter_pdf_rows(
+    pdf_path: str | Path, backend: str | None = None, workers: int = 1,
+) -> Iterator[tuple[str, str, str, str]]:
+    """
+    Lazily yield (date, sum, description, details) tuples from a statement.
+
+    Sequential extraction streams page by page, so callers that build their
+    own container never hold a second full list of rows.  Arguments are as
+    for ``parse_pdf``.
     """
     pdf_path = Path(pdf_path)
     if not pdf_path.exists():
         raise FileNotFoundError(f"PDF not found: {pdf_path}")
+    return _iter_pdf_rows(pdf_path, backend, workers)
 
-    rows: list[tuple[str, str, str, str]] = []
 
-    with pdfplumber.open(pdf_path) as pdf:
-        for page in pdf.pages:
-            tables = page.extract_tables()
-            for table in tables:
-                for row in table:
-                    if not _is_data_row(row):
-                        continue
-                    date = row[0].strip()
-                    sum_str = row[1].strip()
-                    description = row[2].strip()
-                    details = _clean_details(row[3])
-                    rows.append((date, sum_str, description, details))
+def parse_pdf(
+    pdf_path: str | Path, backend: str | None = None, workers: int = 1,
+) -> list[tuple[str, str, str, str]]:
+    """
+    Parse a ForteBank card statement PDF into a list of transaction tuples.
 
-    return rows
+    Returns a list of (date, sum, description, details) tuples.  *backend*
+    picks the table extractor (see ``PDF_BACKENDS``).  With *workers* > 1,
+    statements longer than two pages are split across that many processes;
+    leave it at 1 when already running inside a pool.
+    """
+    return list(iter_pdf_rows(pdf_path, backend, workers))
@@ -1,7 +1,9 @@
 """MCP server exposing ForteBank invoice parsing and spending analytics."""
 
+import functools
 import json
 import sys
+from operator import itemgetter
 from pathlib import Path
 
 # Prevent stray stdout (e.g. newlines from libs or exception handlers) from
@@ -32,10 +34,11 @@ class _StdoutFilter:
 
 sys.stdout = _StdoutFilter(_real_stdout)
 
+import orjson
 from mcp.server.fastmcp import FastMCP
 
 from budged import (
-    parse_pdf,
+    iter_pdf_rows,
     parse_transactions,
     group_by_description_and_mcc,
     group_by_description_and_mcc_group,
@@ -44,6 +47,7 @@ from budged import (
     format_aggregated,
     mcc2name,
     mcc_groups,
+    Transactions,
     SORT_BY_SUM,
     SORT_BY_NAME,
     SORT_BY_DATE,
@@ -66,6 +70,57 @@ mcp = FastMCP(
 DEFAULT_DIR = "./statements"
 
 
+def _dump(payload) -> str:
+    """Serialize a tool result as indented UTF-8 JSON."""
+    return orjson.dumps(payload, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS).decode()
+
+
+@functools.lru_cache(maxsize=32)
+def _load_parsed(
+    path_str: str, mtime_ns: int, size: int,
+) -> tuple[tuple[tuple[str, str, str, str], ...], Transactions]:
+    """Parse a statement once per (path, mtime, size).
+
+    Cached results are shared between tool calls and must not be mutated.
+    """
+    raw = tuple(iter_pdf_rows(path_str))
+    return raw, parse_transactions(raw)
+
+
+def _load_statement(path: Path) -> tuple[tuple[tuple[str, str, str, str], ...], Transactions]:
+    """Return raw rows and parsed transactions for *path*, reusing earlier parses."""
+    st = path.stat()
+    return _load_parsed(str(path), st.st_mtime_ns, st.st_size)
+
+
+def _iter_invoice_rows(parsed: Transactions):
+    """Yield one parse_invoice transaction dict per parsed row."""
+    for i in range(len(parsed)):
+        mcc = parsed.mccs[i]
+        yield {
+            "date": parsed.dates[i],
+            "amount_kzt": parsed.sums[i],
+            "description": parsed.descriptions[i],
+            "merchant": parsed.merchants[i],
+            "mcc_code": mcc,
+            "mcc_name": mcc2name.get(mcc, None) if mcc else None,
+            "bank": parsed.banks[i],
+            "payment_method": parsed.payment_methods[i],
+            "receiver_account": parsed.receiver_accounts[i],
+            "raw_details": parsed.raws[i],
+        }
+
+
+# Escape pipes so cells don't break the markdown table; flatten newlines.
+_CELL_ESCAPE = str.maketrans({"|": "\\|", "\n": " "})
+
+
+def _trim(details: str | None, limit: int = 80) -> str:
+    """Escape a details cell and cut it to *limit* characters."""
+    text = (details or "").translate(_CELL_ESCAPE).strip()
+    return text if len(text) <= limit else text[:limit - 3] + "..."
+
+
 @mcp.tool()
 def list_statements(directory: str = DEFAULT_DIR) -> str:
     """List available PDF statement files in a directory.
@@ -79,11 +134,11 @@ def list_statements(directory: str = DEFAULT_DIR) -> str:
         return json.dumps({"error": f"Directory not found: {pdf_dir}"})
 
     pdfs = sorted(pdf_dir.glob("*.pdf"))
-    return json.dumps({
+    return _dump({
         "directory": str(pdf_dir),
         "files": [{"name": p.name, "path": str(p)} for p in pdfs],
         "count": len(pdfs),
-    }, indent=2)
+    })
 
 
 @mcp.tool()
@@ -100,32 +155,24 @@ def parse_invoice(pdf_path: str) -> str:
     if not path.exists():
         return json.dumps({"error": f"File not found: {path}"})
 
-    raw = parse_pdf(path)
-    parsed = parse_transactions(raw)
-
-    transactions = []
-    for row in parsed:
-        transactions.append({
-            "date": row["Date"],
-            "amount_kzt": row["Sum"],
-            "description": row["Description"],
-            "merchant": row["Details"]["merchant"],
-            "mcc_code": row["Details"]["mcc"],
-            "mcc_name": mcc2name.get(row["Details"]["mcc"], None) if row["Details"]["mcc"] else None,
-            "bank": row["Details"]["bank"],
-            "payment_method": row["Details"]["payment_method"],
-            "receiver_account": row["Details"]["receiver_account"],
-            "raw_details": row["Details"]["raw"],
+    raw, parsed = _load_statement(path)
+    if not raw:
+        return _dump({
+            "file": path.name,
+            "transaction_count": 0,
+            "transactions": [],
+            "totals": dict.fromkeys(
+                ("purchase_total", "bonuses_total", "net_purchases", "grand_total", "income_total"),
+                0.0,
+            ),
         })
 
-    totals = compute_purchase_totals(parsed)
-
-    return json.dumps({
+    return _dump({
         "file": path.name,
-        "transaction_count": len(transactions),
-        "transactions": transactions,
-        "totals": totals,
-    }, indent=2, ensure_ascii=False)
+        "transaction_count": len(parsed),
+        "transactions": list(_iter_invoice_rows(parsed)),
+        "totals": compute_purchase_totals(parsed),
+    })
 
 
 @mcp.tool()
@@ -150,8 +197,7 @@ def spending_summary(
     if not path.exists():
         return json.dumps({"error": f"File not found: {path}"})
 
-    raw = parse_pdf(path)
-    parsed = parse_transactions(raw)
+    _, parsed = _load_statement(path)
 
     if group_by == "mcc":
         agg = group_by_description_and_mcc(parsed)
@@ -163,8 +209,10 @@ def spending_summary(
     if sort_by not in (SORT_BY_SUM, SORT_BY_NAME):
         sort_by = SORT_BY_SUM
 
+    totals = compute_purchase_totals(parsed)
+
     if output_format in (FMT_ASCII, FMT_SIMPLE):
-        return format_aggregated(agg, title, sort_by, output_format)
+        return format_aggregated(agg, title, sort_by, output_format, totals)
 
     categories: dict[str, float] = {}
     for (desc, category), total in agg.items():
@@ -173,14 +221,12 @@ def spending_summary(
         categories.setdefault(category, 0.0)
         categories[category] += total
 
-    totals = compute_purchase_totals(parsed)
-
-    return json.dumps({
+    return _dump({
         "file": path.name,
         "group_by": group_by,
-        "categories": dict(sorted(categories.items(), key=lambda x: x[1])),
+        "categories": dict(sorted(categories.items(), key=itemgetter(1))),
         "totals": totals,
-    }, indent=2, ensure_ascii=False)
+    })
 
 
 @mcp.tool()
@@ -201,8 +247,7 @@ def raw_transactions_report(
     if not path.exists():
         return json.dumps({"error": f"File not found: {path}"})
 
-    raw = parse_pdf(path)
-    parsed = parse_transactions(raw)
+    _, parsed = _load_statement(path)
 
     if sort_by not in (SORT_BY_SUM, SORT_BY_NAME, SORT_BY_DATE):
         sort_by = SORT_BY_SUM
@@ -214,10 +259,10 @@ def raw_transactions_report(
 @mcp.tool()
 def get_categories() -> str:
     """Return the MCC code mappings and spending category groups used for classification."""
-    return json.dumps({
+    return _dump({
         "mcc_codes": mcc2name,
         "category_groups": mcc_groups,
-    }, indent=2, ensure_ascii=False)
+    })
 
 
 @mcp.tool()
@@ -237,26 +282,22 @@ def parse_statement_raw(pdf_path: str) -> str:
     if not path.exists():
         return f"Error: File not found: {path}"
 
-    raw = parse_pdf(path)
+    raw, _ = _load_statement(path)
     if not raw:
         return f"# ForteBank statement: {path.name}\n\nNo transactions found in PDF."
 
-    lines = [
+    header = [
         f"# ForteBank statement: {path.name}",
         f"Transactions: {len(raw)}",
         "",
         "| Date | Sum | Description | Details |",
         "|------|-----|--------------|----------|",
     ]
-    for date, sum_str, description, details in raw:
-        # Escape pipe chars in cells so the table doesn't break
-        description_safe = (description or "").replace("|", "\\|").replace("\n", " ")
-        details_safe = (details or "").replace("|", "\\|").replace("\n", " ").strip()
-        if len(details_safe) > 80:
-            details_safe = details_safe[:77] + "..."
-        lines.append(f"| {date} | {sum_str} | {description_safe} | {details_safe} |")
-
-    return "\n".join(lines)
+    body = [
+        f"| {date} | {sum_str} | {(description or '').translate(_CELL_ESCAPE)} | {_trim(details)} |"
+        for date, sum_str, description, details in raw
+    ]
+    return "\n".join(header + body)
 
 
 if __name__ == "__main__":
@@ -1,5 +1,10 @@
 """CLI entry point for parsing ForteBank PDF statements."""
 
+import os
+import pickle
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import suppress
+from functools import partial
 from pathlib import Path
 
 from budged import (
@@ -11,8 +16,10 @@ from budged import (
     REPORT_RAW,
     REPORT_MCC,
     REPORT_GROUP,
+    Transactions,
     parse_pdf,
     parse_transactions,
+    resolve_backend,
     group_by_description_and_mcc,
     group_by_description_and_mcc_group,
     format_aggregated,
@@ -24,16 +31,70 @@ from budged.parser import DATE_PATTERN, SUM_PATTERN, _clean_details, _is_data_ro
 from budged.formatter import format_ascii_table
 
 
+CACHE_DIR = Path(".cache")
+# Bump when parse_pdf output changes so stale cache entries are ignored.
+_CACHE_VERSION = 3
+
+
+def parse_pdf_cached(
+    pdf_file: Path, cache_dir: Path = CACHE_DIR, workers: int = 1,
+) -> list[tuple[str, str, str, str]]:
+    """
+    ``parse_pdf`` with an on-disk pickle cache keyed on file size, mtime and
+    the extraction backend in effect.
+
+    A missing or unreadable cache entry falls back to parsing the PDF and
+    rewriting the entry; failing to write it only costs the next run a parse.
+    """
+    backend = resolve_backend()
+    st = pdf_file.stat()
+    cache_file = (
+        cache_dir / f"{pdf_file.stem}-{st.st_size}-{st.st_mtime_ns}-{backend}-v{_CACHE_VERSION}.pkl"
+    )
+    try:
+        with cache_file.open("rb") as f:
+            return pickle.load(f)
+    except Exception:  # missing, truncated or written by an incompatible version
+        pass
+
+    raw_data = parse_pdf(pdf_file, backend, workers=workers)
+    tmp_file = cache_file.with_suffix(f".{os.getpid()}.tmp")
+    try:
+        cache_dir.mkdir(parents=True, exist_ok=True)
+        with tmp_file.open("wb") as f:
+            pickle.dump(raw_data, f, protocol=pickle.HIGHEST_PROTOCOL)
+        tmp_file.replace(cache_file)
+    except (OSError, pickle.PicklingError):  # read-only directory, full disk, ...
+        with suppress(OSError):
+            tmp_file.unlink(missing_ok=True)
+    return raw_data
+
+
+def _parse_one(
+    pdf_file: Path, use_cache: bool = True, workers: int = 1,
+) -> tuple[list[tuple[str, str, str, str]], Transactions]:
+    """Parse a single statement, optionally splitting its pages across *workers*."""
+    if use_cache:
+        raw_data = parse_pdf_cached(pdf_file, workers=workers)
+    else:
+        raw_data = parse_pdf(pdf_file, workers=workers)
+    return raw_data, parse_transactions(raw_data)
+
+
 def print_table(data, title: str | None = None):
     """
     Pretty-print any of the common data shapes used in this module.
 
     Supported shapes:
-    - ``list[dict]``  – parsed_data (each dict becomes a row)
+    - ``Transactions`` – parsed_data (one row per transaction)
+    - ``list[dict]``  – each dict becomes a row
     - ``list[tuple]`` – raw tuples from parse_pdf
     - ``dict[tuple, float]`` – mcc_agg / group_agg
     """
-    if isinstance(data, dict):
+    if isinstance(data, Transactions):
+        headers = ["date", "sum", "description", "details"]
+        rows = [list(row) for row in zip(data.dates, data.sums, data.descriptions, data.raws)]
+    elif isinstance(data, dict):
         sample_key = next(iter(data))
         if isinstance(sample_key, tuple):
             n = len(sample_key)
@@ -98,6 +159,12 @@ if __name__ == "__main__":
         default="./statements",
         help="Directory containing PDF statements (default: ./statements)",
     )
+    parser.add_argument(
+        "--no-cache",
+        action="store_false",
+        dest="use_cache",
+        help=f"Always re-parse PDFs instead of reusing results cached in {CACHE_DIR}/",
+    )
     args = parser.parse_args()
 
     pdf_dir = Path(args.statements_dir)
@@ -107,23 +174,32 @@ if __name__ == "__main__":
         print("No PDF files found in resources/", file=sys.stderr)
         sys.exit(1)
 
-    for pdf_file in pdfs:
-        print(f"=== {pdf_file.name} ===")
-        raw_data = parse_pdf(pdf_file)
-        print(f"Parsed {len(raw_data)} transactions\n")
+    # Parsing is CPU-bound, so statements are parsed in parallel; results
+    # come back in input order and are printed afterwards.  A lone statement
+    # is split by pages instead, keeping pools from nesting.
+    parse_one = partial(_parse_one, use_cache=args.use_cache)
+    if len(pdfs) == 1:
+        results = [parse_one(pdfs[0], workers=os.cpu_count() or 1)]
+    else:
+        with ProcessPoolExecutor(max_workers=min(len(pdfs), os.cpu_count() or 1)) as executor:
+            results = list(executor.map(parse_one, pdfs))
 
-        parsed_data = parse_transactions(raw_data)
+    # Render every report first and hand stdout a single write.
+    out: list[str] = []
+    for pdf_file, (raw_data, parsed_data) in zip(pdfs, results):
+        out.append(f"=== {pdf_file.name} ===\n")
+        out.append(f"Parsed {len(raw_data)} transactions\n\n")
 
         if args.report == REPORT_RAW:
-            print(format_raw_report(parsed_data, args.sort, args.fmt))
-            print()
+            report = format_raw_report(parsed_data, args.sort, args.fmt)
         elif args.report == REPORT_MCC:
             agg_sort = args.sort if args.sort != SORT_BY_DATE else SORT_BY_SUM
             mcc_agg = group_by_description_and_mcc(parsed_data)
-            print(format_aggregated(mcc_agg, "Grouped by Description and MCC Name", agg_sort, args.fmt))
-            print()
+            report = format_aggregated(mcc_agg, "Grouped by Description and MCC Name", agg_sort, args.fmt)
         else:
             agg_sort = args.sort if args.sort != SORT_BY_DATE else SORT_BY_SUM
             group_agg = group_by_description_and_mcc_group(parsed_data)
-            print(format_aggregated(group_agg, "Grouped by Description and MCC Group", agg_sort, args.fmt))
-            print()
+            report = format_aggregated(group_agg, "Grouped by Description and MCC Group", agg_sort, args.fmt)
+        out.append(f"{report}\n\n")
+
+    sys.stdout.write("".join(out))
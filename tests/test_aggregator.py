@@ -0,0 +1,70 @@
+from budged.aggregator import (
+    compute_purchase_totals,
+    group_by_description_and_mcc,
+    group_by_description_and_mcc_group,
+)
+from budged.parser import parse_transactions
+
+RAW = [
+    ("01.02.2025", "-1000.00 KZT", "Purchase", "WOLT, MCC: 5814"),
+    ("02.02.2025", "-200.00 KZT", "Purchase with bonuses", "WOLT, MCC: 5814"),
+    ("03.02.2025", "-500.00 KZT", "Transfer", "Receiver: 440043******8791"),
+    ("04.02.2025", "-300.00 KZT", "Purchase", "MAGNUM, MCC: 5411"),
+    ("05.02.2025", "-50.00 KZT", "Purchase", "WOLT, MCC: 5814"),
+    ("06.02.2025", "90000.00 KZT", "Replenishment", "Salary"),
+]
+
+
+# ---------------------------------------------------------------------------
+# group_by_description_and_mcc
+# ---------------------------------------------------------------------------
+
+class TestGroupByDescriptionAndMcc:
+    def test_sums_and_bonus_split(self):
+        agg = group_by_description_and_mcc(parse_transactions(RAW))
+        assert agg == {
+            ("Purchase", "Fast Food Restaurants"): -1250.0,
+            ("Saved with bonuses", "Fast Food Restaurants"): -200.0,
+            ("Transfer", "No MCC"): -500.0,
+            ("Purchase", "Grocery Stores, Supermarkets"): -300.0,
+            ("Replenishment", "No MCC"): 90000.0,
+        }
+
+    def test_keeps_first_seen_order(self):
+        agg = group_by_description_and_mcc(parse_transactions(RAW))
+        assert list(agg)[:3] == [
+            ("Purchase", "Fast Food Restaurants"),
+            ("Saved with bonuses", "Fast Food Restaurants"),
+            ("Transfer", "No MCC"),
+        ]
+
+    def test_empty(self):
+        assert group_by_description_and_mcc(parse_transactions([])) == {}
+
+
+# ---------------------------------------------------------------------------
+# group_by_description_and_mcc_group
+# ---------------------------------------------------------------------------
+
+class TestGroupByDescriptionAndMccGroup:
+    def test_rolls_codes_into_groups(self):
+        agg = group_by_description_and_mcc_group(parse_transactions(RAW))
+        assert agg[("Purchase", "Food & Dining")] == -1550.0
+        assert agg[("Saved with bonuses", "Food & Dining")] == -200.0
+        assert agg[("Transfer", "Transfers/Other")] == -500.0
+
+
+# ---------------------------------------------------------------------------
+# compute_purchase_totals
+# ---------------------------------------------------------------------------
+
+class TestComputePurchaseTotals:
+    def test_totals(self):
+        totals = compute_purchase_totals(parse_transactions(RAW))
+        assert totals == {
+            "purchase_total": -1550.0,
+            "bonuses_total": -200.0,
+            "net_purchases": -1350.0,
+            "grand_total": 87950.0,
+            "income_total": 90000.0,
+        }
@@ -0,0 +1,92 @@
+import pytest
+
+from budged.aggregator import compute_purchase_totals, group_by_description_and_mcc_group
+from budged.formatter import (
+    FMT_ASCII,
+    FMT_SIMPLE,
+    SORT_BY_DATE,
+    SORT_BY_NAME,
+    format_aggregated,
+    format_ascii_table,
+    format_raw_report,
+)
+from budged.parser import parse_transactions
+
+RAW = [
+    ("05.01.2026", "-1000.00 KZT", "Purchase", "ZARA, MCC: 5691"),
+    ("31.12.2025", "-200.00 KZT", "Purchase with bonuses", "WOLT, MCC: 5814"),
+    ("01.02.2026", "-500.00 KZT", "Transfer", "Receiver: 440043******8791"),
+    ("15.12.2024", "-300.00 KZT", "Purchase", "ARBUZ, MCC: 5411"),
+    ("20.01.2026", "90000.00 KZT", "Account replenishment", "Salary"),
+]
+
+
+# ---------------------------------------------------------------------------
+# format_ascii_table
+# ---------------------------------------------------------------------------
+
+class TestFormatAsciiTable:
+    def test_layout(self):
+        table = format_ascii_table(["Name", "Sum"], [["Food", -1500.0]], title="T")
+        assert table.splitlines() == [
+            "T",
+            "┌──────┬───────────┐",
+            "│ Name │ Sum       │",
+            "├──────┼───────────┤",
+            "│ Food │ -1,500.00 │",
+            "└──────┴───────────┘",
+        ]
+
+    def test_numeric_column_right_aligned(self):
+        table = format_ascii_table(["Sum (KZT)"], [[1.0], [""], [-12000.0]])
+        lines = table.splitlines()
+        assert lines[3] == "│       1.00 │"
+        assert lines[4] == "│            │"
+        assert lines[5] == "│ -12,000.00 │"
+
+    def test_text_column_left_aligned(self):
+        table = format_ascii_table(["Description"], [["Purchase"], ["Transfer"]])
+        assert "│ Purchase    │" in table.splitlines()
+
+    def test_none_renders_empty(self):
+        table = format_ascii_table(["A", "B"], [[None, "x"]])
+        assert "│   │ x │" in table.splitlines()
+
+
+# ---------------------------------------------------------------------------
+# format_aggregated
+# ---------------------------------------------------------------------------
+
+class TestFormatAggregated:
+    @pytest.mark.parametrize("fmt", [FMT_ASCII, FMT_SIMPLE])
+    def test_precomputed_totals_match_fallback(self, fmt):
+        parsed = parse_transactions(RAW)
+        agg = group_by_description_and_mcc_group(parsed)
+        with_totals = format_aggregated(agg, "T", fmt=fmt, totals=compute_purchase_totals(parsed))
+        assert with_totals == format_aggregated(agg, "T", fmt=fmt)
+        assert "-1500.00" in with_totals.replace(",", "")
+
+
+# ---------------------------------------------------------------------------
+# format_raw_report
+# ---------------------------------------------------------------------------
+
+def _report_lines(sort_by: str) -> list[str]:
+    report = format_raw_report(parse_transactions(RAW), sort_by, FMT_SIMPLE)
+    return report.splitlines()[1:len(RAW) + 1]
+
+
+class TestFormatRawReport:
+    def test_date_order_across_month_and_year(self):
+        dates = [line.split()[0] for line in _report_lines(SORT_BY_DATE)]
+        assert dates == ["15.12.2024", "31.12.2025", "05.01.2026", "20.01.2026", "01.02.2026"]
+
+    def test_name_order_by_description_then_details(self):
+        labels = [line.rsplit("KZT  ", 1)[1] for line in _report_lines(SORT_BY_NAME)]
+        assert labels == [
+            "—",
+            "ARBUZ [5411]",
+            "ZARA [5691]",
+            "WOLT [5814]",
+            "card *8791",
+        ]
@@ -0,0 +1,107 @@
+import json
+import os
+import shutil
+from pathlib import Path
+
+import pytest
+
+pytest.importorskip("mcp")
+
+import mcp_server
+from tools.forte_generator import generate_forte_pdf
+
+TEST_PDF = Path(__file__).resolve().parent / "resources" / "test.pdf"
+
+
+@pytest.fixture(autouse=True)
+def _fresh_cache():
+    mcp_server._load_parsed.cache_clear()
+    yield
+    mcp_server._load_parsed.cache_clear()
+
+
+# ---------------------------------------------------------------------------
+# _load_statement
+# ---------------------------------------------------------------------------
+
+class TestLoadStatement:
+    def test_reparses_only_when_file_changes(self, tmp_path, monkeypatch):
+        pdf = shutil.copy(TEST_PDF, tmp_path / "statement.pdf")
+        calls = []
+        iter_pdf_rows = mcp_server.iter_pdf_rows
+
+        def counting(path_str):
+            calls.append(path_str)
+            return iter_pdf_rows(path_str)
+
+        monkeypatch.setattr(mcp_server, "iter_pdf_rows", counting)
+
+        first = mcp_server.parse_invoice(str(pdf))
+        assert mcp_server.parse_invoice(str(pdf)) == first
+        assert len(calls) == 1
+
+        st = os.stat(pdf)
+        os.utime(pdf, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+        assert mcp_server.parse_invoice(str(pdf)) == first
+        assert len(calls) == 2
+
+
+# ---------------------------------------------------------------------------
+# parse_invoice
+# ---------------------------------------------------------------------------
+
+class TestParseInvoice:
+    def test_empty_statement(self, tmp_path):
+        pdf = generate_forte_pdf([], tmp_path / "empty.pdf")
+        assert json.loads(mcp_server.parse_invoice(str(pdf))) == {
+            "file": "empty.pdf",
+            "transaction_count": 0,
+            "transactions": [],
+            "totals": {
+                "purchase_total": 0.0,
+                "bonuses_total": 0.0,
+                "net_purchases": 0.0,
+                "grand_total": 0.0,
+                "income_total": 0.0,
+            },
+        }
+
+    def test_transactions(self):
+        payload = json.loads(mcp_server.parse_invoice(str(TEST_PDF)))
+        assert payload["transaction_count"] == len(payload["transactions"]) == 20
+        assert payload["transactions"][1]["mcc_name"] == "Grocery Stores, Supermarkets"
+
+
+# ---------------------------------------------------------------------------
+# parse_statement_raw
+# ---------------------------------------------------------------------------
+
+def _old_details_cell(details):
+    """Details cell as parse_statement_raw built it before _trim."""
+    safe = (details or "").replace("|", "\\|").replace("\n", " ").strip()
+    return safe[:77] + "..." if len(safe) > 80 else safe
+
+
+class TestParseStatementRaw:
+    @pytest.mark.parametrize("details", [
+        None,
+        "",
+        "WOLT, MCC: 5814",
+        " A|B\nC ",
+        "x" * 80,
+        "x" * 81,
+        "|" * 45,
+        "MAGNUM CASH&CARRY, JSC Halyk Bank, MCC: 5411, APPLE PAY, with a tail of text",
+    ])
+    def test_trim_matches_old_cell(self, details):
+        assert mcp_server._trim(details) == _old_details_cell(details)
+
+    def test_escapes_pipes_and_cuts_long_details(self, tmp_path):
+        details = "A|B SHOP, " + "x" * 90
+        pdf = generate_forte_pdf(
+            [("01.02.2025", "-10.00 KZT", "Pay|ment", details)], tmp_path / "pipes.pdf",
+        )
+        lines = mcp_server.parse_statement_raw(str(pdf)).splitlines()
+        (raw,) = mcp_server.iter_pdf_rows(pdf)
+        assert lines[-1] == f"| 01.02.2025 | -10.00 KZT | Pay\\|ment | {_old_details_cell(raw[3])} |"
+        assert lines[-1].endswith("... |")
@@ -1,18 +1,26 @@
+from dataclasses import FrozenInstanceError
 from pathlib import Path
 
 import pytest
 
-from tools.forte_generator import SAMPLE_TRANSACTIONS
+from tools.forte_generator import SAMPLE_TRANSACTIONS, generate_forte_pdf
 from budged.parser import (
     DATE_PATTERN,
     SUM_PATTERN,
     _clean_details,
     _is_data_row,
+    iter_pdf_rows,
+    parse_details,
     parse_pdf,
+    parse_row,
+    parse_sum,
 )
 
 TEST_PDF = Path(__file__).resolve().parent / "resources" / "test.pdf"
 
+# A first row with an empty cell can't be used to learn the column layout.
+FEE_ROW = ("31.01.2026", "-100.00 KZT", "Fee", "")
+
 
 # ---------------------------------------------------------------------------
 # _clean_details
@@ -28,6 +36,9 @@ class TestCleanDetails:
     def test_collapses_multiple_spaces(self):
         assert _clean_details("too  many   spaces") == "too many spaces"
 
+    def test_collapses_mixed_whitespace_around_wraps(self):
+        assert _clean_details("  WOLT, \n\tMCC: 5814  ") == "WOLT, MCC: 5814"
+
     def test_none_returns_empty_string(self):
         assert _clean_details(None) == ""
 
@@ -70,6 +81,99 @@ class TestIsDataRow:
         row = ["Card account statement ...", None, None, None]
         assert _is_data_row(row) is False
 
+    def test_cells_do_not_spill_into_each_other(self):
+        row = ["01.02.2025 -5", "KZT", "x", "y"]
+        assert _is_data_row(row) is False
+
+
+# ---------------------------------------------------------------------------
+# parse_sum
+# ---------------------------------------------------------------------------
+
+class TestParseSum:
+    def test_negative(self):
+        assert parse_sum("-30000.00 KZT") == -30000.0
+
+    def test_positive(self):
+        assert parse_sum("112950.86 KZT") == 112950.86
+
+    def test_thousands_separators(self):
+        assert parse_sum("1,234.50 KZT") == 1234.5
+        assert parse_sum("-1\xa0000.00 KZT") == -1000.0
+        assert parse_sum("12\u202f500.00 KZT") == 12500.0
+
+    def test_garbage_returns_zero(self):
+        assert parse_sum("KZT") == 0.0
+
+
+# ---------------------------------------------------------------------------
+# parse_details
+# ---------------------------------------------------------------------------
+
+class TestParseDetails:
+    def test_purchase_fields(self):
+        details = parse_details("MAGNUM CASH&CARRY, JSC Halyk Bank, MCC: 5411, APPLE PAY")
+        assert details.merchant == "MAGNUM CASH&CARRY"
+        assert details.bank == "Halyk Bank"
+        assert details.mcc == "5411"
+        assert details.payment_method == "APPLE PAY"
+        assert details.receiver_account is None
+
+    def test_transfer_has_no_merchant(self):
+        details = parse_details("Receiver: 440043******8791")
+        assert details.receiver_account == "440043******8791"
+        assert details.merchant is None
+        assert details.mcc is None
+
+    def test_cyrillic_mcc_label(self):
+        assert parse_details("Store, МСС: 5812").mcc == "5812"
+
+    def test_case_insensitive_apple_pay(self):
+        assert parse_details("Store, MCC: 5812, Apple Pay").payment_method == "APPLE PAY"
+
+    def test_bank_keywords(self):
+        assert parse_details("Kaspi Magazin, Kaspi Bank, MCC: 5943").bank == "Kaspi Bank"
+        assert parse_details("Shop, BCC, MCC: 5411").bank == "BCC"
+        assert parse_details("Shop, Halyk Bank, MCC: 5411").bank == "Halyk Bank"
+
+    def test_bank_priority_not_position(self):
+        assert parse_details("ABCCAFE, Kaspi Bank, MCC: 5812").bank == "Kaspi Bank"
+        assert parse_details("BCC SHOP, JSC Halyk Bank, MCC: 5411").bank == "Halyk Bank"
+
+    def test_mcc_name_and_group_resolved(self):
+        details = parse_details("WOLT, MCC: 5814")
+        assert (details.mcc_name, details.mcc_group) == ("Fast Food Restaurants", "Food & Dining")
+        details = parse_details("Shop, MCC: 0001")
+        assert (details.mcc_name, details.mcc_group) == ("Unknown/No MCC", "Other Uncategorized")
+        details = parse_details("Receiver: 440043******8791")
+        assert (details.mcc_name, details.mcc_group) == ("No MCC", "Transfers/Other")
+
+    def test_shared_result_is_immutable(self):
+        details = parse_details("WOLT, MCC: 5814")
+        with pytest.raises(FrozenInstanceError):
+            details.mcc = "0000"
+        assert parse_details("WOLT, MCC: 5814").mcc == "5814"
+
+    def test_plain_text(self):
+        details = parse_details("Salary")
+        assert details.raw == "Salary"
+        assert details.merchant is None
+        assert details.bank is None
+
+
+# ---------------------------------------------------------------------------
+# parse_row
+# ---------------------------------------------------------------------------
+
+class TestParseRow:
+    def test_fields(self):
+        row = parse_row(" 01.02.2025 ", "-1,500.00 KZT", " Purchase ", "WOLT, MCC: 5814")
+        assert row.date == "01.02.2025"
+        assert row.sum == -1500.0
+        assert row.description == "Purchase"
+        assert row.details.mcc == "5814"
+        assert row.details.merchant == "WOLT"
+
 
 # ---------------------------------------------------------------------------
 # parse_pdf – integration tests against the generated statement
@@ -140,3 +244,95 @@ class TestParsePdf:
             assert original[3] in parsed[3] or parsed[3] in original[3], (
                 f"Details mismatch:\n  parsed:   {parsed[3]!r}\n  original: {original[3]!r}"
             )
+
+    def test_first_row_with_empty_details_is_kept(self, tmp_path):
+        pdf = generate_forte_pdf([FEE_ROW] + SAMPLE_TRANSACTIONS, tmp_path / "fee.pdf")
+        rows = parse_pdf(pdf)
+        assert len(rows) == len(SAMPLE_TRANSACTIONS) + 1
+        assert rows[0] == FEE_ROW
+
+    def test_statement_without_full_rows(self, tmp_path):
+        pdf = generate_forte_pdf([FEE_ROW, FEE_ROW], tmp_path / "fees.pdf")
+        assert parse_pdf(pdf) == [FEE_ROW, FEE_ROW]
+
+    def test_first_page_without_full_rows(self, tmp_path):
+        expected = [FEE_ROW] * 60 + SAMPLE_TRANSACTIONS
+        pdf = generate_forte_pdf(expected, tmp_path / "fees.pdf")
+        assert parse_pdf(pdf) == expected
+
+    def test_pages_held_until_boundaries_known(self, tmp_path, monkeypatch):
+        # Without a recognisable header, page 1 can only be sliced with the
+        # boundaries learned on page 2.
+        monkeypatch.setattr("budged.parser._HEADER_CELLS", [])
+        expected = [FEE_ROW] * 60 + SAMPLE_TRANSACTIONS
+        pdf = generate_forte_pdf(expected, tmp_path / "fees.pdf")
+        assert parse_pdf(pdf) == expected
+
+    @pytest.mark.parametrize("valign", ["MIDDLE", "BOTTOM"])
+    def test_wrapped_text_above_date_line(self, tmp_path, valign):
+        pdf = generate_forte_pdf(SAMPLE_TRANSACTIONS, tmp_path / "valign.pdf", valign=valign)
+        assert parse_pdf(pdf) == SAMPLE_TRANSACTIONS
+
+
+# ---------------------------------------------------------------------------
+# parse_pdf backends
+# ---------------------------------------------------------------------------
+
+class TestPdfBackends:
+    @pytest.mark.parametrize("backend", ["pymupdf", "pdfplumber"])
+    def test_optional_backend_matches_default(self, backend, transactions):
+        pytest.importorskip(backend)
+        assert parse_pdf(TEST_PDF, backend=backend) == transactions
+
+    def test_env_var_selects_backend(self, monkeypatch):
+        monkeypatch.setenv("PARSE_PDF_BACKEND", "no-such-backend")
+        with pytest.raises(ValueError, match="no-such-backend"):
+            parse_pdf(TEST_PDF)
+
+    def test_unknown_backend(self):
+        with pytest.raises(ValueError, match="expected one of"):
+            parse_pdf(TEST_PDF, backend="tabula")
+
+
+# ---------------------------------------------------------------------------
+# parse_pdf with page-parallel workers
+# ---------------------------------------------------------------------------
+
+@pytest.fixture(scope="module")
+def long_pdf(tmp_path_factory):
+    return generate_forte_pdf(SAMPLE_TRANSACTIONS * 10, tmp_path_factory.mktemp("pdf") / "long.pdf")
+
+
+class TestParsePdfWorkers:
+    def test_matches_sequential(self, long_pdf):
+        expected = parse_pdf(long_pdf)
+        assert len(expected) == len(SAMPLE_TRANSACTIONS) * 10
+        assert parse_pdf(long_pdf, workers=3) == expected
+
+    def test_short_statement_stays_in_process(self, transactions):
+        assert parse_pdf(TEST_PDF, workers=4) == transactions
+
+    def test_keeps_row_above_first_full_row(self, tmp_path):
+        pdf = generate_forte_pdf(([FEE_ROW] + SAMPLE_TRANSACTIONS) * 10, tmp_path / "fee.pdf")
+        rows = parse_pdf(pdf, workers=3)
+        assert rows[0] == FEE_ROW
+        assert rows == parse_pdf(pdf)
+        assert len(rows) == (len(SAMPLE_TRANSACTIONS) + 1) * 10
+
+    def test_first_page_without_full_rows(self, tmp_path):
+        expected = [FEE_ROW] * 60 + SAMPLE_TRANSACTIONS * 5
+        pdf = generate_forte_pdf(expected, tmp_path / "fees.pdf")
+        assert parse_pdf(pdf, workers=3) == expected
+
+
+# ---------------------------------------------------------------------------
+# iter_pdf_rows
+# ---------------------------------------------------------------------------
+
+class TestIterPdfRows:
+    def test_yields_same_rows_as_parse_pdf(self, long_pdf):
+        assert list(iter_pdf_rows(long_pdf)) == parse_pdf(long_pdf)
+
+    def test_missing_file_raises_before_iteration(self, tmp_path):
+        with pytest.raises(FileNotFoundError):
+            iter_pdf_rows(tmp_path / "missing.pdf")
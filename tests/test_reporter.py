@@ -0,0 +1,70 @@
+from pathlib import Path
+
+import pytest
+
+import reporter
+
+TEST_PDF = Path(__file__).resolve().parent / "resources" / "test.pdf"
+
+
+# ---------------------------------------------------------------------------
+# parse_pdf_cached
+# ---------------------------------------------------------------------------
+
+class TestParsePdfCached:
+    def test_writes_and_reuses_cache(self, tmp_path, monkeypatch):
+        first = reporter.parse_pdf_cached(TEST_PDF, cache_dir=tmp_path)
+        assert first == reporter.parse_pdf(TEST_PDF)
+        assert len(list(tmp_path.glob("*.pkl"))) == 1
+
+        def fail(*_, **__):
+            raise AssertionError("PDF re-parsed despite cache entry")
+
+        monkeypatch.setattr(reporter, "parse_pdf", fail)
+        assert reporter.parse_pdf_cached(TEST_PDF, cache_dir=tmp_path) == first
+
+    def test_corrupt_entry_is_rebuilt(self, tmp_path):
+        expected = reporter.parse_pdf_cached(TEST_PDF, cache_dir=tmp_path)
+        (cache_file,) = tmp_path.glob("*.pkl")
+        cache_file.write_bytes(b"not a pickle")
+        assert reporter.parse_pdf_cached(TEST_PDF, cache_dir=tmp_path) == expected
+
+    def test_unwritable_cache_dir_still_returns_rows(self, tmp_path):
+        blocker = tmp_path / "not-a-dir"
+        blocker.write_text("")
+        rows = reporter.parse_pdf_cached(TEST_PDF, cache_dir=blocker / "cache")
+        assert rows == reporter.parse_pdf(TEST_PDF)
+
+    def test_failed_dump_leaves_no_temp_file(self, tmp_path, monkeypatch):
+        def disk_full(*_, **__):
+            raise OSError(28, "No space left on device")
+
+        monkeypatch.setattr(reporter.pickle, "dump", disk_full)
+        rows = reporter.parse_pdf_cached(TEST_PDF, cache_dir=tmp_path)
+        assert rows == reporter.parse_pdf(TEST_PDF)
+        assert list(tmp_path.iterdir()) == []
+
+    def test_backend_is_part_of_the_key(self, tmp_path, monkeypatch):
+        pytest.importorskip("pdfplumber")
+        reporter.parse_pdf_cached(TEST_PDF, cache_dir=tmp_path)
+        monkeypatch.setenv("PARSE_PDF_BACKEND", "pdfplumber")
+        calls = []
+        monkeypatch.setattr(reporter, "parse_pdf", lambda *args, **kwargs: calls.append(args) or [])
+        reporter.parse_pdf_cached(TEST_PDF, cache_dir=tmp_path)
+        assert calls == [(TEST_PDF, "pdfplumber")]
+        assert len(list(tmp_path.glob("*.pkl"))) == 2
+
+
+# ---------------------------------------------------------------------------
+# print_table
+# ---------------------------------------------------------------------------
+
+class TestPrintTable:
+    def test_transactions_one_row_each(self, capsys):
+        parsed = reporter.parse_transactions(
+            [("01.02.2025", "-1,500.00 KZT", "Purchase", "WOLT, MCC: 5814")]
+        )
+        reporter.print_table(parsed)
+        lines = capsys.readouterr().out.splitlines()
+        assert lines[1] == "│ date       │ sum       │ description │ details         │"
+        assert lines[3] == "│ 01.02.2025 │ -1,500.00 │ Purchase    │ WOLT, MCC: 5814 │"
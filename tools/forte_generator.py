@@ -41,6 +41,7 @@ SAMPLE_TRANSACTIONS: list[tuple[str, str, str, str]] = [
 def generate_forte_pdf(
     transactions: list[tuple[str, str, str, str]] = SAMPLE_TRANSACTIONS,
     output_path: str | Path = DEFAULT_OUTPUT,
+    valign: str = "TOP",
 ) -> Path:
     """Generate a ForteBank-style card statement PDF.
 
@@ -50,6 +51,9 @@ def generate_forte_pdf(
         List of ``(date, sum, description, details)`` tuples.
     output_path:
         Where to write the PDF file.
+    valign:
+        Vertical alignment of cell content: ``"TOP"``, ``"MIDDLE"`` or
+        ``"BOTTOM"``.
 
     Returns
     -------
@@ -106,7 +110,7 @@ def generate_forte_pdf(
         ("FONTNAME", (0, 1), (-1, -1), "Helvetica"),
         ("FONTSIZE", (0, 1), (-1, -1), 8),
         ("GRID", (0, 0), (-1, -1), 0.5, colors.grey),
-        ("VALIGN", (0, 0), (-1, -1), "TOP"),
+        ("VALIGN", (0, 0), (-1, -1), valign),
         ("LEFTPADDING", (0, 0), (-1, -1), 4),
         ("RIGHTPADDING", (0, 0), (-1, -1), 4),
         ("TOPPADDING", (0, 0), (-1, -1), 3),